@@ -16,23 +16,256 @@ Usage:
 Optional Dependencies:
     For enhanced functionality, you can install these optional packages:
     - GitPython: `pip install gitpython`
+    - lxml: `pip install lxml` (faster Info.plist parsing and writing)
     - PyGithub: `pip install PyGithub` (for future GitHub API integration)
     - GitHub CLI (`gh`): Required for automatic Homebrew tap submission
 """
 
 import argparse
+import base64
+import concurrent.futures
+import functools
+import hashlib
+import http.client
 import importlib.util
+import json
+import mmap
 import os
 import plistlib
 import re
 import shutil
+import stat
 import subprocess
+import sys
 import tempfile
+import urllib.error
+import urllib.request
 from datetime import datetime
 from pathlib import Path
 
 # Check for optional dependencies
 HAVE_GITPYTHON = importlib.util.find_spec("git") is not None
+HAVE_LXML = importlib.util.find_spec("lxml") is not None
+HAVE_PYGITHUB = importlib.util.find_spec("github") is not None
+
+PLIST_HEADER = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+PLIST_DOCTYPE = (
+    b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">'
+)
+PLIST_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+BINARY_PLIST_MAGIC = b"bplist00"
+
+# Matches the version line and the release download URL in the Homebrew formula
+FORMULA_VERSION_RE = re.compile(
+    r'(?P<version>version "[\d\.]+")'
+    r'|(?P<url>url "https://github\.com/barnuri/win-dock/releases/download/v[\d\.]+/WinDock\.zip")'
+)
+
+# Placeholder in the formula/cask that gets replaced with the release ZIP checksum
+SHA256_PLACEHOLDER = b"sha256 :no_check"
+
+# Upper bound on commits listed in release notes when there is no previous tag
+RELEASE_NOTES_MAX_COMMITS = 100
+
+# Read size and socket timeout (seconds) used when streaming the release ZIP
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = 60
+
+HOMEBREW_TAP_URL = "https://github.com/barnuri/homebrew-brew"
+HOMEBREW_TAP_README = """# Homebrew Tap for WinDock
+
+This is the official Homebrew tap for WinDock.
+
+## Installation
+
+```bash
+brew tap barnuri/brew
+brew install barnuri/brew/windock --no-quarantine
+```
+"""
+
+# Detaches all mounted WinDock volumes and prints the path of each one that was detached
+UNMOUNT_WINDOCK_VOLUMES_SCRIPT = r"""mount |
+awk '/WinDock/ && /\/Volumes\// {sub(/^.* on /, ""); sub(/ \(.*/, ""); print}' |
+while IFS= read -r volume; do
+    hdiutil detach "$volume" >/dev/null 2>&1 && echo "$volume"
+done"""
+
+
+def _subprocess_runner(cwd):
+    """Return a subprocess.run preset for running a group of commands in cwd."""
+    # Children get /dev/null as stdin so they can't read from (or consume) the script's own stdin
+    return functools.partial(subprocess.run, cwd=cwd, stdin=subprocess.DEVNULL)
+
+
+def _new_sha256():
+    """Create a SHA256 hasher for integrity checksums (not used for security)."""
+    return hashlib.new("sha256", usedforsecurity=False)
+
+
+def _file_sha256(path):
+    """Return the SHA256 hex digest of a local file without spawning shasum."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, _new_sha256).hexdigest()
+        # Python < 3.11: hash a read-only memory map of the file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            digest = _new_sha256()
+            digest.update(mapped)
+            return digest.hexdigest()
+
+
+def _plist_value_from_element(element):
+    """Convert an lxml plist element into the matching Python value."""
+    tag = element.tag
+    if tag == "dict":
+        result = {}
+        key = None
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue  # Skip comments and processing instructions
+            if child.tag == "key":
+                key = child.text or ""
+            else:
+                result[key] = _plist_value_from_element(child)
+        return result
+    if tag == "array":
+        return [_plist_value_from_element(child) for child in element if isinstance(child.tag, str)]
+    if tag == "string":
+        return element.text or ""
+    if tag == "integer":
+        return int(element.text)
+    if tag == "real":
+        return float(element.text)
+    if tag == "true":
+        return True
+    if tag == "false":
+        return False
+    if tag == "date":
+        return datetime.strptime(element.text, PLIST_DATE_FORMAT)
+    if tag == "data":
+        return base64.b64decode(element.text or "")
+    raise ValueError(f"Unsupported plist element: <{tag}>")
+
+
+def _plist_element_from_value(value, depth=0):
+    """Convert a Python value, nested depth levels below the top, into the matching lxml plist element."""
+    from lxml import etree
+
+    if isinstance(value, dict):
+        element = etree.Element("dict")
+        # Sort keys like plistlib.dump does so the file layout stays stable
+        for key in sorted(value):
+            etree.SubElement(element, "key").text = key
+            element.append(_plist_element_from_value(value[key], depth + 1))
+    elif isinstance(value, (list, tuple)):
+        element = etree.Element("array")
+        for item in value:
+            element.append(_plist_element_from_value(item, depth + 1))
+    elif isinstance(value, bool):
+        element = etree.Element("true" if value else "false")
+    elif isinstance(value, int):
+        element = etree.Element("integer")
+        element.text = str(value)
+    elif isinstance(value, float):
+        element = etree.Element("real")
+        element.text = repr(value)
+    elif isinstance(value, datetime):
+        element = etree.Element("date")
+        element.text = value.strftime(PLIST_DATE_FORMAT)
+    elif isinstance(value, (bytes, bytearray)):
+        element = etree.Element("data")
+        # plistlib wraps the base64 into lines at the tag's own indent, narrower the deeper it is nested
+        indent = "\t" * depth
+        chunk_size = max(16, 76 - 8 * depth) // 4 * 3
+        lines = (base64.b64encode(value[i : i + chunk_size]).decode("ascii") for i in range(0, len(value), chunk_size))
+        element.text = "\n" + "".join(f"{indent}{line}\n" for line in lines) + indent
+    elif isinstance(value, str):
+        element = etree.Element("string")
+        element.text = value
+    else:
+        raise TypeError(f"Unsupported plist value type: {type(value).__name__}")
+    return element
+
+
+def _plist_load_lxml(path):
+    """Load an XML plist using lxml's C parser."""
+    from lxml import etree
+
+    with open(path, "rb") as f:
+        root = etree.parse(f).getroot()
+
+    for child in root:
+        if isinstance(child.tag, str):
+            return _plist_value_from_element(child)
+    raise ValueError(f"Empty plist: {path}")
+
+
+def _plist_read_key_lxml(path, key):
+    """Stream an XML plist and return the top-level value for key, stopping as soon as it is parsed."""
+    from lxml import etree
+
+    with open(path, "rb") as f:
+        for _, element in etree.iterparse(f, events=("end",)):
+            previous = element.getprevious()
+            if previous is None or previous.tag != "key" or previous.text != key:
+                continue
+            # Only match keys of the top-level <dict> (plist -> dict -> value)
+            container = element.getparent()
+            if container.getparent() is None or container.getparent().getparent() is not None:
+                continue
+            value = _plist_value_from_element(element)
+            element.clear()
+            return value
+    return None
+
+
+def _plist_dump_lxml(data, path):
+    """Write an XML plist using lxml, matching plistlib's output layout."""
+    from lxml import etree
+
+    root = etree.Element("plist", version="1.0")
+    top_level = _plist_element_from_value(data)
+    # plistlib keeps the top-level element flush with <plist>, so indent from there
+    etree.indent(top_level, space="\t")
+    top_level.tail = "\n"
+    root.text = "\n"
+    root.append(top_level)
+
+    with open(path, "wb") as f:
+        f.write(PLIST_HEADER + PLIST_DOCTYPE + b"\n")
+        f.write(etree.tostring(root, encoding="UTF-8"))
+        f.write(b"\n")
+
+
+def _is_binary_plist(path):
+    """Check the file signature to tell binary plists apart from XML ones."""
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_PLIST_MAGIC)) == BINARY_PLIST_MAGIC
+
+
+def _plist_load(path):
+    """Load a plist file, using lxml for XML plists when available and plistlib otherwise."""
+    if HAVE_LXML and not _is_binary_plist(path):
+        return _plist_load_lxml(path)
+    with open(path, "rb") as f:
+        return plistlib.load(f)
+
+
+def _plist_read_value(path, key):
+    """Read a single top-level value from a plist, or None if the key is missing."""
+    if HAVE_LXML and not _is_binary_plist(path):
+        return _plist_read_key_lxml(path, key)
+    return _plist_load(path).get(key)
+
+
+def _plist_dump(data, path):
+    """Write a plist file, using lxml when available and plistlib otherwise."""
+    if HAVE_LXML:
+        _plist_dump_lxml(data, path)
+        return
+    with open(path, "wb") as f:
+        plistlib.dump(data, f)
 
 
 class ReleaseManager:
@@ -42,9 +275,32 @@ class ReleaseManager:
         self.build_dir = self.root_dir / "build"
         self.release_dir = self.build_dir / "Build" / "Products" / "Release"
         self.app_path = self.release_dir / "WinDock.app"
+        # ETag/Last-Modified validators and SHA256 of previously downloaded release ZIPs
+        self.download_cache_path = self.root_dir / ".cache" / "windock-etags.json"
         self.current_version = None
         self.new_version = None
+        self.zip_url = None
         self.dry_run = False
+        # Local copy of the release ZIP to hash instead of downloading it (defaults to the built ZIP once uploaded)
+        self.local_zip = None
+        # Set by create_github_release once the built WinDock.zip has actually been published
+        self.zip_uploaded = False
+        # SHA256 of the released ZIP, shared by every formula/cask checksum update
+        self._release_sha256 = None
+        # Look up the GitHub CLI on PATH once instead of spawning `gh --version` at each use
+        self.has_gh = shutil.which("gh") is not None
+
+    @functools.cached_property
+    def _repo(self):
+        """GitPython repository for the project, opened once and shared by all git steps."""
+        import git
+
+        return git.Repo(self.root_dir)
+
+    @functools.cached_property
+    def _origin(self):
+        """The project's 'origin' remote, resolved once."""
+        return self._repo.remote("origin")
 
     def run(self, version_type="patch"):
         """Main execution flow for the release process."""
@@ -59,10 +315,18 @@ class ReleaseManager:
         self.build_app()
         # self.create_dmg()
 
-        # Git operations
-        self.commit_version_bump()
-        self.create_tag()
-        self.generate_release_notes()
+        # Package the app in the background while the git steps run; they don't touch the build output.
+        # Release notes still run after the commit since they are based on HEAD^.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            zip_future = executor.submit(self._create_app_zip)
+
+            # Git operations
+            self.commit_version_bump()
+            self.create_tag()
+            self.generate_release_notes()
+
+            zip_future.result()
+
         self.create_github_release()
         self.submit_to_homebrew()
 
@@ -88,32 +352,27 @@ class ReleaseManager:
 
         # Unmount any existing WinDock volumes
         try:
-            # Try to unmount any mounted WinDock volumes
-            result = subprocess.run(["mount"], capture_output=True, text=True)
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if "WinDock" in line and "/Volumes/" in line:
-                        # Extract volume path
-                        parts = line.split(" on ")
-                        if len(parts) > 1:
-                            volume_path = parts[1].split(" (")[0]
-                            try:
-                                subprocess.run(["hdiutil", "detach", volume_path], capture_output=True, check=False)
-                                print(f"🗑️ Unmounted {volume_path}")
-                            except Exception:
-                                pass
+            # Scan mounts and detach every WinDock volume in a single shell pipeline,
+            # echoing back each volume that was detached successfully
+            result = subprocess.run(
+                ["sh", "-c", UNMOUNT_WINDOCK_VOLUMES_SCRIPT], capture_output=True, text=True, check=False
+            )
+            for volume_path in result.stdout.splitlines():
+                print(f"🗑️ Unmounted {volume_path}")
         except Exception:
             pass  # Ignore any errors during cleanup
 
     def get_current_version(self):
-        """Get the current version from Info.plist."""
+        """Get the current version from Info.plist, reading the file only on the first call."""
+        if self.current_version is not None:
+            return self.current_version
+
         try:
-            # Read Info.plist using Python's plistlib instead of plutil
-            with open(self.info_plist_path, "rb") as f:
-                plist_data = plistlib.load(f)
+            # Read only the version key from Info.plist instead of parsing the whole file
+            version = _plist_read_value(self.info_plist_path, "CFBundleShortVersionString")
 
-            if "CFBundleShortVersionString" in plist_data:
-                self.current_version = plist_data["CFBundleShortVersionString"]
+            if version is not None:
+                self.current_version = version
                 print(f"📊 Current version: {self.current_version}")
             else:
                 self.current_version = "1.0.0"
@@ -121,6 +380,8 @@ class ReleaseManager:
         except Exception as e:
             raise RuntimeError(f"❌ Error reading Info.plist: {e}")
 
+        return self.current_version
+
     def calculate_new_version(self, version_type):
         """Calculate the new version based on the bump type."""
         try:
@@ -143,6 +404,7 @@ class ReleaseManager:
 
             self.new_version = f"{major}.{minor}.{patch}"
             self.tag_name = f"v{self.new_version}"
+            self.zip_url = f"https://github.com/barnuri/win-dock/releases/download/{self.tag_name}/WinDock.zip"
             print(f"📈 New version: {self.new_version}")
         except Exception as e:
             raise RuntimeError(f"❌ Error calculating new version: {e}")
@@ -155,16 +417,14 @@ class ReleaseManager:
 
         try:
             # Read the current plist data
-            with open(self.info_plist_path, "rb") as f:
-                plist_data = plistlib.load(f)
+            plist_data = _plist_load(self.info_plist_path)
 
             # Update versions
             plist_data["CFBundleShortVersionString"] = self.new_version
             plist_data["CFBundleVersion"] = self.new_version
 
             # Write the updated plist back to file
-            with open(self.info_plist_path, "wb") as f:
-                plistlib.dump(plist_data, f)
+            _plist_dump(plist_data, self.info_plist_path)
 
             print(f"📝 Updated Info.plist with version {self.new_version}")
 
@@ -186,15 +446,12 @@ class ReleaseManager:
             with open(formula_path, "r") as f:
                 content = f.read()
 
-            # Update version
-            updated_content = re.sub(r'version "[\d\.]+"', f'version "{self.new_version}"', content)
-
-            # Update the URL to use the new version
-            updated_content = re.sub(
-                r'url "https://github\.com/barnuri/win-dock/releases/download/v[\d\.]+/WinDock\.zip"',
-                f'url "https://github.com/barnuri/win-dock/releases/download/v{self.new_version}/WinDock.zip"',
-                updated_content,
-            )
+            # Update the version and the download URL in a single pass over the file
+            replacements = {
+                "version": f'version "{self.new_version}"',
+                "url": f'url "{self.zip_url}"',
+            }
+            updated_content = FORMULA_VERSION_RE.sub(lambda match: replacements[match.lastgroup], content)
 
             # Write back to file
             with open(formula_path, "w") as f:
@@ -212,11 +469,13 @@ class ReleaseManager:
         # We still need to run the build script as it contains Xcode build commands
         try:
             build_script = self.root_dir / "build.sh"
-            # Ensure script is executable
-            os.chmod(build_script, 0o755)
+            # Ensure script is executable, only touching it when the bit is missing
+            mode = build_script.stat().st_mode
+            if not mode & stat.S_IXUSR:
+                os.chmod(build_script, stat.S_IMODE(mode) | 0o755)
 
             # Run the build script
-            subprocess.run([str(build_script)], check=True)
+            subprocess.run([str(build_script)], cwd=self.root_dir, check=True)
 
             # Verify the build was successful
             if not self.app_path.exists():
@@ -225,13 +484,15 @@ class ReleaseManager:
             print("✅ Build successful")
 
             # List files in the Release directory using Python instead of ls
+            # (os.scandir reuses the file type from the directory listing)
             print(f"Contents of {self.release_dir}:")
-            for item in self.release_dir.iterdir():
-                item_stats = item.stat()
-                size = item_stats.st_size
-                mod_time = datetime.fromtimestamp(item_stats.st_mtime).strftime("%b %d %H:%M")
-                is_dir = "d" if item.is_dir() else "-"
-                print(f"{is_dir} {size:10} {mod_time} {item.name}")
+            with os.scandir(self.release_dir) as entries:
+                for entry in entries:
+                    entry_stats = entry.stat(follow_symlinks=False)
+                    size = entry_stats.st_size
+                    mod_time = datetime.fromtimestamp(entry_stats.st_mtime).strftime("%b %d %H:%M")
+                    is_dir = "d" if entry.is_dir(follow_symlinks=False) else "-"
+                    print(f"{is_dir} {size:10} {mod_time} {entry.name}")
 
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"❌ Build failed: {e}")
@@ -256,18 +517,16 @@ class ReleaseManager:
 
             # Unmount any existing WinDock volumes that might be mounted
             try:
-                volume_name = f"WinDock {self.new_version}"
-                subprocess.run(
-                    ["hdiutil", "detach", f"/Volumes/{volume_name}"],
-                    capture_output=True,
-                    check=False,  # Don't fail if nothing to detach
-                )
-                # Also try to detach any generic WinDock volumes
-                subprocess.run(
-                    ["hdiutil", "detach", "/Volumes/WinDock"],
-                    capture_output=True,
-                    check=False,  # Don't fail if nothing to detach
-                )
+                # Check the mount point first so hdiutil only runs when there is something to detach
+                for volume_name in (f"WinDock {self.new_version}", "WinDock"):
+                    volume_path = f"/Volumes/{volume_name}"
+                    if os.path.ismount(volume_path):
+                        subprocess.run(
+                            ["hdiutil", "detach", volume_path],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            check=False,  # Don't fail if nothing to detach
+                        )
             except Exception:
                 pass  # Ignore detach errors
 
@@ -275,9 +534,9 @@ class ReleaseManager:
             with tempfile.TemporaryDirectory() as temp_dir:
                 dmg_temp = Path(temp_dir)
 
-                # Copy the app to the temporary directory
+                # Clone the app into the temporary directory without duplicating its data
                 app_copy_dest = dmg_temp / "WinDock.app"
-                shutil.copytree(self.app_path, app_copy_dest)
+                self._clone_app_bundle(app_copy_dest)
 
                 # Create symbolic link to Applications
                 applications_link = dmg_temp / "Applications"
@@ -295,10 +554,9 @@ class ReleaseManager:
                         "-srcfolder",
                         str(dmg_temp),
                         "-ov",
+                        # LZFSE-compressed image: much faster to create than UDZO at zlib-level=9
                         "-format",
-                        "UDZO",
-                        "-imagekey",
-                        "zlib-level=9",
+                        "ULFO",
                         str(dmg_path),
                     ],
                     check=True,
@@ -320,6 +578,23 @@ class ReleaseManager:
         except Exception as e:
             raise RuntimeError(f"❌ Error during DMG creation: {e}")
 
+    def _clone_app_bundle(self, destination):
+        """Copy the app bundle to destination using APFS clones or hard links when possible."""
+        if sys.platform == "darwin":
+            # cp -c uses clonefile(2), so no file data is copied on APFS volumes
+            result = subprocess.run(["cp", "-cR", str(self.app_path), str(destination)], check=False)
+            if result.returncode == 0:
+                return
+            shutil.rmtree(destination, ignore_errors=True)
+
+        try:
+            # Hard links are safe here because the destination is a throwaway temp directory
+            shutil.copytree(self.app_path, destination, symlinks=True, copy_function=os.link)
+        except OSError:
+            # Hard links don't work across filesystems, fall back to a regular copy
+            shutil.rmtree(destination, ignore_errors=True)
+            shutil.copytree(self.app_path, destination, symlinks=True)
+
     def commit_version_bump(self):
         """Commit the version bump to git."""
         print("📝 Committing version bump...")
@@ -341,18 +616,14 @@ class ReleaseManager:
             try:
                 import git
 
-                repo = git.Repo(self.root_dir)
-
-                # Stage the files
-                for file_path in files_to_commit:
-                    repo.git.add(file_path)
+                # Stage all files with a single git invocation
+                self._repo.git.add("--", *files_to_commit)
 
                 # Commit changes
-                repo.index.commit(f"Bump version to {self.new_version}")
+                self._repo.index.commit(f"Bump version to {self.new_version}")
 
                 # Push changes
-                origin = repo.remote("origin")
-                push_info = origin.push()
+                push_info = self._origin.push()
 
                 if not push_info[0].flags & git.PushInfo.ERROR:
                     print("✅ Changes committed and pushed successfully")
@@ -373,13 +644,13 @@ class ReleaseManager:
             files_to_commit = [str(self.info_plist_path)]
 
         try:
-            # Add and commit changes
-            for file_path in files_to_commit:
-                subprocess.run(["git", "add", file_path], check=True)
-            subprocess.run(["git", "commit", "-m", f"Bump version to {self.new_version}"], check=True)
+            # Stage all files with a single git invocation, then commit the index like the GitPython path
+            subprocess.run(["git", "add", "--", *files_to_commit], cwd=self.root_dir, check=True)
+            commit_message = f"Bump version to {self.new_version}"
+            subprocess.run(["git", "commit", "-m", commit_message], cwd=self.root_dir, check=True)
 
             # Push changes
-            push_result = subprocess.run(["git", "push"], capture_output=True, text=True)
+            push_result = subprocess.run(["git", "push"], cwd=self.root_dir, capture_output=True, text=True)
             if push_result.returncode != 0:
                 print(f"⚠️ Warning: Could not push version bump commit: {push_result.stderr}")
                 print("You may need to push manually with 'git push'")
@@ -402,14 +673,11 @@ class ReleaseManager:
             try:
                 import git
 
-                repo = git.Repo(self.root_dir)
-
                 # Create tag
-                repo.create_tag(self.tag_name, message=f"Version {self.new_version}")
+                self._repo.create_tag(self.tag_name, message=f"Version {self.new_version}")
 
                 # Push tag
-                origin = repo.remote("origin")
-                push_info = origin.push(self.tag_name)
+                push_info = self._origin.push(self.tag_name)
 
                 if not push_info[0].flags & git.PushInfo.ERROR:
                     print(f"✅ Tag {self.tag_name} created and pushed successfully")
@@ -428,8 +696,10 @@ class ReleaseManager:
         """Helper method to create and push tag using subprocess."""
         try:
             # Create and push tag
-            subprocess.run(["git", "tag", self.tag_name], check=True)
-            push_result = subprocess.run(["git", "push", "origin", self.tag_name], capture_output=True, text=True)
+            subprocess.run(["git", "tag", self.tag_name], cwd=self.root_dir, check=True)
+            push_result = subprocess.run(
+                ["git", "push", "origin", self.tag_name], cwd=self.root_dir, capture_output=True, text=True
+            )
 
             if push_result.returncode != 0:
                 print(f"⚠️ Warning: Could not push tag: {push_result.stderr}")
@@ -446,43 +716,43 @@ class ReleaseManager:
         try:
             # Check if we have GitPython available
             if HAVE_GITPYTHON:
-                # Import GitPython here to avoid errors if it's not installed
                 import git
 
-                # Initialize repository
-                repo = git.Repo(self.root_dir)
+                # Reuse the repository opened by the earlier git steps
+                repo = self._repo
 
-                # Try to get the previous tag
-                last_tag = None
-                for tag in repo.tags:
-                    last_tag = tag.name
-                    break  # Get the most recent tag
+                # Ask git for the most recent tag reachable from the previous commit
+                try:
+                    last_tag = repo.git.describe("--tags", "--abbrev=0", "HEAD^")
+                except git.GitCommandError:
+                    last_tag = None
 
-                # Get commits since last tag or all commits if no tag
+                # Get commits since last tag or the latest commits if no tag
                 if last_tag:
-                    commits_text = []
-                    for commit in repo.iter_commits(f"{last_tag}..HEAD^"):
-                        commits_text.append(f"- {commit.summary}")
-                    commits = "\n".join(commits_text)
+                    commits_iter = repo.iter_commits(f"{last_tag}..HEAD^", no_merges=True)
                 else:
-                    commits_text = []
-                    for commit in repo.iter_commits():
-                        commits_text.append(f"- {commit.summary}")
-                    commits = "\n".join(commits_text)
+                    commits_iter = repo.iter_commits(max_count=RELEASE_NOTES_MAX_COMMITS, no_merges=True)
+                commits = "\n".join(f"- {commit.summary}" for commit in commits_iter)
             else:
                 # Fallback to subprocess if GitPython is not available
                 get_last_tag = subprocess.run(
-                    ["git", "describe", "--tags", "--abbrev=0", "HEAD^"], capture_output=True, text=True
+                    ["git", "describe", "--tags", "--abbrev=0", "HEAD^"],
+                    cwd=self.root_dir,
+                    capture_output=True,
+                    text=True,
                 )
 
-                # Get commits since last tag or all commits if no tag
+                # Get commits since last tag or the latest commits if no tag
+                commits_cmd = ["git", "log", "--no-merges", "--pretty=format:- %s"]
                 if get_last_tag.returncode == 0:
                     last_tag = get_last_tag.stdout.strip()
-                    commits_cmd = ["git", "log", "--oneline", "--pretty=format:- %s", f"{last_tag}..HEAD^"]
+                    commits_cmd.append(f"{last_tag}..HEAD^")
                 else:
-                    commits_cmd = ["git", "log", "--oneline", "--pretty=format:- %s", "HEAD"]
+                    commits_cmd += ["-n", str(RELEASE_NOTES_MAX_COMMITS), "HEAD"]
 
-                commits = subprocess.run(commits_cmd, capture_output=True, text=True, check=True).stdout
+                commits = subprocess.run(
+                    commits_cmd, cwd=self.root_dir, capture_output=True, text=True, check=True
+                ).stdout
 
             # Create release notes content
             self.release_notes = f"""## What's Changed
@@ -508,6 +778,45 @@ class ReleaseManager:
             self.release_notes = f"## WinDock {self.new_version}\n\nReleased on {datetime.now().strftime('%Y-%m-%d')}"
             print("Using basic release notes instead.")
 
+    def _create_app_zip(self):
+        """Create a ZIP archive of the app bundle for the GitHub release and Homebrew formula."""
+        app_zip_file = self.root_dir / "WinDock.zip"
+
+        if self.dry_run:
+            print(f"🔍 [DRY RUN] Would create ZIP archive: {app_zip_file.name}")
+            return
+
+        if self.app_path.exists():
+            print("📦 Creating ZIP archive of WinDock.app...")
+            try:
+                if sys.platform == "darwin":
+                    # ditto is macOS native and handles bundle metadata much faster than zipfile
+                    subprocess.run(
+                        [
+                            "ditto",
+                            "-c",
+                            "-k",
+                            "--sequesterRsrc",
+                            "--keepParent",
+                            str(self.app_path),
+                            str(app_zip_file),
+                        ],
+                        check=True,
+                    )
+                else:
+                    # Use shutil.make_archive to create a proper zip archive
+                    shutil.make_archive(
+                        str(app_zip_file)[:-4],  # Path without .zip extension
+                        "zip",  # Archive format
+                        self.release_dir,  # Root directory to archive
+                        "WinDock.app",  # Base directory to include
+                    )
+                print(f"✅ Created ZIP archive: {app_zip_file}")
+            except Exception as e:
+                print(f"⚠️ Warning: Failed to create ZIP archive: {e}")
+        else:
+            print(f"⚠️ Warning: App bundle not found at {self.app_path}")
+
     def create_github_release(self):
         """Create a GitHub release using the GitHub CLI if available."""
         print("🌐 Creating GitHub release...")
@@ -516,46 +825,18 @@ class ReleaseManager:
             print(f"🔍 [DRY RUN] Would create GitHub release for tag {self.tag_name}")
             return
 
-        # Try to check if PyGithub is available as an alternative to gh CLI
-        try:
-            import importlib.util
-
-            pygithub_spec = importlib.util.find_spec("github")
-            has_pygithub = pygithub_spec is not None
-        except Exception:
-            has_pygithub = False
-
         # Check if GitHub CLI is installed (preferred method)
-        has_gh_cli = False
-        try:
-            subprocess.run(["gh", "--version"], capture_output=True, check=True)
-            has_gh_cli = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            has_gh_cli = False
+        has_gh_cli = self.has_gh
 
-        if not (has_gh_cli or has_pygithub):
+        # PyGithub is an alternative to the gh CLI
+        if not (has_gh_cli or HAVE_PYGITHUB):
             print("⚠️ Neither GitHub CLI (gh) nor PyGithub found. Skipping GitHub release creation.")
             print("To create the release manually, go to the repository's releases page")
             print(f"and create a new release with tag '{self.tag_name}'.")
             return
 
-        # Create a ZIP archive of the app bundle
+        # The ZIP archive is created by _create_app_zip right after the build
         app_zip_file = self.root_dir / "WinDock.zip"
-        if self.app_path.exists():
-            print("📦 Creating ZIP archive of WinDock.app...")
-            try:
-                # Use shutil.make_archive to create a proper zip archive
-                shutil.make_archive(
-                    str(app_zip_file)[:-4],  # Path without .zip extension
-                    "zip",  # Archive format
-                    self.release_dir,  # Root directory to archive
-                    "WinDock.app",  # Base directory to include
-                )
-                print(f"✅ Created ZIP archive: {app_zip_file}")
-            except Exception as e:
-                print(f"⚠️ Warning: Failed to create ZIP archive: {e}")
-        else:
-            print(f"⚠️ Warning: App bundle not found at {self.app_path}")
 
         # Check if the DMG file exists
         dmg_file = self.root_dir / "WinDock.dmg"
@@ -566,12 +847,21 @@ class ReleaseManager:
         release_name = f"WinDock {self.new_version}"
         body_path = self.root_dir / "release_notes.md"
 
+        # Collect the release assets that were actually produced
+        assets = [str(asset) for asset in (dmg_file, app_zip_file) if asset.exists()]
+
         # We'll use GitHub CLI for now since PyGithub would require authentication setup
         # which is beyond the scope of this conversion
         if has_gh_cli:
             try:
                 # Check if release already exists
-                check_release = subprocess.run(["gh", "release", "view", self.tag_name], capture_output=True)
+                # Only the exit status matters, so discard the output instead of capturing it
+                check_release = subprocess.run(
+                    ["gh", "release", "view", self.tag_name],
+                    cwd=self.root_dir,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
 
                 if check_release.returncode == 0:
                     # Update existing release
@@ -587,10 +877,20 @@ class ReleaseManager:
                             "--notes-file",
                             str(body_path),
                         ],
+                        cwd=self.root_dir,
                         check=True,
                     )
+
+                    # Upload all assets in one call, overwriting any that already exist
+                    if assets:
+                        print(f"📤 Uploading {len(assets)} asset(s) to release {self.tag_name}...")
+                        subprocess.run(
+                            ["gh", "release", "upload", self.tag_name, *assets, "--clobber"],
+                            cwd=self.root_dir,
+                            check=True,
+                        )
                 else:
-                    # Create new release
+                    # Create new release with all assets attached in the same call
                     print(f"🆕 Creating new release {self.tag_name}...")
                     create_cmd = [
                         "gh",
@@ -601,40 +901,11 @@ class ReleaseManager:
                         release_name,
                         "--notes-file",
                         str(body_path),
+                        *assets,
                     ]
+                    subprocess.run(create_cmd, cwd=self.root_dir, check=True)
 
-                    # Add assets if they exist
-                    if dmg_file.exists():
-                        create_cmd.append(str(dmg_file))
-                    if app_zip_file.exists():
-                        create_cmd.append(str(app_zip_file))
-
-                    subprocess.run(create_cmd, check=True)
-
-                # Upload assets if not already present
-                if dmg_file.exists():
-                    print(f"📤 Uploading {dmg_file.name} to release {self.tag_name}...")
-                    subprocess.run([
-                        "gh",
-                        "release",
-                        "upload",
-                        self.tag_name,
-                        str(dmg_file),
-                        "--clobber",  # Overwrite if already exists
-                    ])
-
-                # Upload ZIP file if not already included
-                if app_zip_file.exists():
-                    print(f"📤 Uploading {app_zip_file.name} to release {self.tag_name}...")
-                    subprocess.run([
-                        "gh",
-                        "release",
-                        "upload",
-                        self.tag_name,
-                        str(app_zip_file),
-                        "--clobber",  # Overwrite if already exists
-                    ])
-
+                self.zip_uploaded = str(app_zip_file) in assets
                 print("✅ GitHub release created/updated successfully")
             except subprocess.CalledProcessError as e:
                 print(f"⚠️ Warning: GitHub release creation failed: {e}")
@@ -649,81 +920,33 @@ class ReleaseManager:
             print("🔍 [DRY RUN] Would submit formula to Homebrew tap")
             return
 
+        # Pushing to the tap requires the GitHub CLI, so skip the clone, download and commit without it
+        if not self.has_gh:
+            print("⚠️ GitHub CLI (gh) not found. Skipping Homebrew tap submission.")
+            print("You may need to update the formula manually in the tap repository.")
+            return
+
         # Check if we're already in a homebrew tap repo or need to clone it
         homebrew_tap_dir = self.root_dir.parent / "homebrew-windock-temp"
         formula_filename = "windock.rb"
 
         try:
-            # Check if we already have the homebrew tap repository
-            if homebrew_tap_dir.exists() and (homebrew_tap_dir / ".git").exists():
-                print("🔄 Resetting existing homebrew tap repository...")
-                # Change to the cloned directory to run git commands
-                original_dir = os.getcwd()
-                os.chdir(homebrew_tap_dir)
-
-                # Reset to clean state and pull latest changes
-                subprocess.run(["git", "reset", "--hard", "HEAD"], check=True)
-                subprocess.run(["git", "clean", "-fd"], check=True)
-                subprocess.run(["git", "checkout", "master"], check=False)  # Don't fail if already on master
-                subprocess.run(["git", "pull", "origin", "master"], check=True)
-
-                # Go back to original directory
-                os.chdir(original_dir)
-            else:
-                # Clean up any existing directory that's not a git repo
-                if homebrew_tap_dir.exists():
-                    shutil.rmtree(homebrew_tap_dir)
-
-                # Clone or create the homebrew tap repository
-                print("📥 Setting up homebrew tap repository...")
-                try:
-                    # Try to clone the existing tap repository
-                    subprocess.run(
-                        ["git", "clone", "https://github.com/barnuri/homebrew-brew", str(homebrew_tap_dir)],
-                        check=True,
-                    )
-                except subprocess.CalledProcessError:
-                    # If the repository doesn't exist, we'll create it locally
-                    print("📝 Creating new homebrew tap repository...")
-                    homebrew_tap_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Change to the new directory
-                    original_dir = os.getcwd()
-                    os.chdir(homebrew_tap_dir)
-
-                    # Initialize git repository
-                    subprocess.run(["git", "init"], check=True)
-                    subprocess.run(["git", "branch", "-M", "master"], check=True)
-
-                    # Create initial structure
-                    formula_dir = homebrew_tap_dir / "Formula"
-                    formula_dir.mkdir(exist_ok=True)
-
-                    # Create initial README
-                    readme_content = """# Homebrew Tap for WinDock
-
-This is the official Homebrew tap for WinDock.
-
-## Installation
-
-```bash
-brew tap barnuri/brew
-brew install barnuri/brew/windock --no-quarantine
-```
-"""
-                    with open(homebrew_tap_dir / "README.md", "w") as f:
-                        f.write(readme_content)
-
-                    # Initial commit
-                    subprocess.run(["git", "add", "README.md"], check=True)
-                    subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
-
-                    # Go back to original directory
-                    os.chdir(original_dir)
-
-            # Change to the tap directory
-            original_dir = os.getcwd()
-            os.chdir(homebrew_tap_dir)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                # Compute the release checksum while the tap repository is being cloned or reset;
+                # _update_checksum below picks up the cached value
+                executor.submit(self._get_release_sha256)
+
+                # Clone, create or reset the homebrew tap repository
+                if HAVE_GITPYTHON:
+                    try:
+                        self._prepare_homebrew_tap_via_gitpython(homebrew_tap_dir)
+                    except Exception as e:
+                        print(f"⚠️ Warning: Homebrew tap setup with GitPython failed: {e}")
+                        print("Falling back to subprocess for homebrew tap setup")
+                        self._prepare_homebrew_tap_via_subprocess(homebrew_tap_dir)
+                else:
+                    # Use subprocess approach if GitPython is not available
+                    self._prepare_homebrew_tap_via_subprocess(homebrew_tap_dir)
 
             # Ensure Formula directory exists
             formula_dir = homebrew_tap_dir / "Formula"
@@ -736,131 +959,251 @@ brew install barnuri/brew/windock --no-quarantine
                 print(f"⚠️ Warning: Local formula file not found at {local_formula_path}")
                 return
 
+            # Remember the tap's current formula so a no-op release can skip the commit and push
+            previous_formula = formula_path.read_bytes() if formula_path.exists() else None
+
             # Copy the formula file
             shutil.copy2(local_formula_path, formula_path)
             print(f"📝 Copied formula to {formula_path}")
 
             # Update the SHA256 checksum in the formula file
-            self.update_formula_checksum(formula_path)
-
-            # Add and commit the formula
-            subprocess.run(["git", "add", str(formula_path)], check=True)
+            self._update_checksum(formula_path, "formula")
 
-            # Check if this is a new formula or an update
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain", str(formula_path)], capture_output=True, text=True
-            )
+            if formula_path.read_bytes() == previous_formula:
+                print("✅ Homebrew tap formula is already up to date, nothing to submit")
+                return
 
-            is_new_formula = status_result.stdout.strip().startswith("A")
+            # The tap was just reset and cleaned, so a formula that existed before the copy is tracked
+            is_new_formula = previous_formula is None
             commit_message = (
                 f"windock {self.new_version} (new formula)" if is_new_formula else f"windock {self.new_version}"
             )
-            subprocess.run(["git", "commit", "-m", commit_message], check=True)
 
-            # Check if we have GitHub CLI
-            subprocess.run(["gh", "--version"], capture_output=True, check=True)
+            # Add and commit the formula; a tracked file can be committed directly by path
+            run_in_tap = _subprocess_runner(homebrew_tap_dir)
+            if is_new_formula:
+                run_in_tap(["git", "add", "--", str(formula_path)], check=True)
+            run_in_tap(["git", "commit", "-m", commit_message, "--", str(formula_path)], check=True)
 
             # Push the branch
-            subprocess.run(["git", "push", "-u", "origin", "master"], check=True)
+            run_in_tap(["git", "push", "-u", "origin", "master"], check=True)
 
         except Exception as e:
             print(f"⚠️ Warning: Homebrew tap submission failed: {e}")
             print("You may need to update the formula manually in the tap repository.")
-        finally:
-            # Return to original directory but keep the homebrew tap repo for future use
-            os.chdir(original_dir)
-
-    def update_formula_checksum(self, formula_path):
-        """Update the SHA256 checksum in the formula file."""
-        try:
-            # Download the ZIP file to calculate its checksum
-            zip_url = f"https://github.com/barnuri/win-dock/releases/download/v{self.new_version}/WinDock.zip"
 
-            print(f"📥 Downloading {zip_url} to calculate checksum...")
-            download_result = subprocess.run(
-                ["curl", "-L", "-o", "/tmp/WinDock.zip", zip_url], capture_output=True, text=True
-            )
+    def _prepare_homebrew_tap_via_gitpython(self, homebrew_tap_dir):
+        """Helper method to clone, create or reset the homebrew tap repository using GitPython."""
+        import git
 
-            if download_result.returncode != 0:
-                print("⚠️ Could not download ZIP file for checksum calculation")
-                return
-
-            # Calculate SHA256
-            checksum_result = subprocess.run(
-                ["shasum", "-a", "256", "/tmp/WinDock.zip"], capture_output=True, text=True, check=True
-            )
+        # Check if we already have the homebrew tap repository
+        if homebrew_tap_dir.exists() and (homebrew_tap_dir / ".git").exists():
+            print("🔄 Resetting existing homebrew tap repository...")
+            repo = git.Repo(homebrew_tap_dir)
 
-            sha256 = checksum_result.stdout.split()[0]
-            print(f"🔍 Calculated SHA256: {sha256}")
-
-            # Update the formula file
-            with open(formula_path, "r") as f:
-                content = f.read()
-
-            # Replace the sha256 line
-            updated_content = re.sub(r"sha256 :no_check", f'sha256 "{sha256}"', content)
-
-            with open(formula_path, "w") as f:
-                f.write(updated_content)
-
-            print("✅ Updated formula with calculated checksum")
-
-            # Clean up temporary file
+            # Reset to clean state, then move to the latest remote commit (no merge needed)
+            repo.git.reset("--hard", "HEAD")
+            repo.git.clean("-fd")
             try:
-                os.unlink("/tmp/WinDock.zip")
-            except Exception:
-                pass
+                repo.git.checkout("master")
+            except git.GitCommandError:
+                pass  # Don't fail if already on master
+            repo.git.fetch("--depth=1", "origin", "master")
+            repo.git.reset("--hard", "FETCH_HEAD")
+            return
 
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️ Error calculating checksum: {e}")
-            print("Using :no_check for SHA256")
-        except Exception as e:
-            print(f"⚠️ Error updating checksum: {e}")
+        # Clean up any existing directory that's not a git repo
+        if homebrew_tap_dir.exists():
+            shutil.rmtree(homebrew_tap_dir)
 
-    def update_cask_checksum(self, cask_path):
-        """Update the SHA256 checksum in the cask file."""
+        # Clone or create the homebrew tap repository
+        print("📥 Setting up homebrew tap repository...")
         try:
-            # Download the ZIP file to calculate its checksum
-            zip_url = f"https://github.com/barnuri/win-dock/releases/download/v{self.new_version}/WinDock.zip"
-
-            print(f"📥 Downloading {zip_url} to calculate checksum...")
-            download_result = subprocess.run(
-                ["curl", "-L", "-o", "/tmp/WinDock.zip", zip_url], capture_output=True, text=True
-            )
+            # Try to clone the existing tap repository
+            git.Repo.clone_from(HOMEBREW_TAP_URL, homebrew_tap_dir, depth=1, single_branch=True, branch="master")
+        except git.GitCommandError:
+            # If the repository doesn't exist, we'll create it locally
+            print("📝 Creating new homebrew tap repository...")
+            homebrew_tap_dir.mkdir(parents=True, exist_ok=True)
+
+            # Initialize git repository
+            repo = git.Repo.init(homebrew_tap_dir)
+            repo.git.branch("-M", "master")
+
+            self._write_homebrew_tap_skeleton(homebrew_tap_dir)
+
+            # Initial commit
+            repo.index.add(["README.md"])
+            repo.index.commit("Initial commit")
+
+    def _prepare_homebrew_tap_via_subprocess(self, homebrew_tap_dir):
+        """Helper method to clone, create or reset the homebrew tap repository using subprocess."""
+        run_in_tap = _subprocess_runner(homebrew_tap_dir)
+
+        # Check if we already have the homebrew tap repository
+        if homebrew_tap_dir.exists() and (homebrew_tap_dir / ".git").exists():
+            print("🔄 Resetting existing homebrew tap repository...")
+
+            # Reset to clean state, then move to the latest remote commit (no merge needed)
+            run_in_tap(["git", "reset", "--hard", "HEAD"], check=True)
+            run_in_tap(["git", "clean", "-fd"], check=True)
+            # Don't fail if already on master
+            run_in_tap(["git", "checkout", "master"], check=False)
+            run_in_tap(["git", "fetch", "--depth=1", "origin", "master"], check=True)
+            run_in_tap(["git", "reset", "--hard", "FETCH_HEAD"], check=True)
+            return
 
-            if download_result.returncode != 0:
-                print("⚠️ Could not download ZIP file for checksum calculation")
-                return
+        # Clean up any existing directory that's not a git repo
+        if homebrew_tap_dir.exists():
+            shutil.rmtree(homebrew_tap_dir)
 
-            # Calculate SHA256
-            checksum_result = subprocess.run(
-                ["shasum", "-a", "256", "/tmp/WinDock.zip"], capture_output=True, text=True, check=True
+        # Clone or create the homebrew tap repository
+        print("📥 Setting up homebrew tap repository...")
+        try:
+            # Try to clone the existing tap repository
+            # Only the latest commit is needed to update the formula
+            _subprocess_runner(homebrew_tap_dir.parent)(
+                [
+                    "git",
+                    "clone",
+                    "--depth=1",
+                    "--single-branch",
+                    "--branch",
+                    "master",
+                    HOMEBREW_TAP_URL,
+                    str(homebrew_tap_dir),
+                ],
+                check=True,
             )
+        except subprocess.CalledProcessError:
+            # If the repository doesn't exist, we'll create it locally
+            print("📝 Creating new homebrew tap repository...")
+            homebrew_tap_dir.mkdir(parents=True, exist_ok=True)
+
+            # Initialize git repository
+            run_in_tap(["git", "init"], check=True)
+            run_in_tap(["git", "branch", "-M", "master"], check=True)
+
+            self._write_homebrew_tap_skeleton(homebrew_tap_dir)
+
+            # Initial commit
+            run_in_tap(["git", "add", "README.md"], check=True)
+            run_in_tap(["git", "commit", "-m", "Initial commit"], check=True)
+
+    def _write_homebrew_tap_skeleton(self, homebrew_tap_dir):
+        """Create the initial Formula directory and README for a new homebrew tap."""
+        formula_dir = homebrew_tap_dir / "Formula"
+        formula_dir.mkdir(exist_ok=True)
+
+        with open(homebrew_tap_dir / "README.md", "w") as f:
+            f.write(HOMEBREW_TAP_README)
+
+    def _get_release_sha256(self):
+        """Return the SHA256 of the released ZIP, downloading it only on the first call."""
+        if self._release_sha256 is not None:
+            return self._release_sha256
+
+        # Only trust the built ZIP once its upload succeeded; a failed clobber would leave an older asset online
+        local_zip = self.local_zip
+        if local_zip is not None and not (local_zip.is_file() and local_zip.stat().st_size > 0):
+            print(f"⚠️ Warning: Local ZIP {local_zip} is missing or empty, downloading the release asset instead")
+            local_zip = None
+        elif local_zip is None and self.zip_uploaded:
+            local_zip = self.root_dir / "WinDock.zip"
+        if local_zip is not None and local_zip.is_file() and local_zip.stat().st_size > 0:
+            self._release_sha256 = _file_sha256(local_zip)
+            print(f"🔍 Calculated SHA256 of {local_zip.name}: {self._release_sha256}")
+            return self._release_sha256
+
+        # Send the validators from the last download so an unchanged asset is answered with 304 and no body
+        download_cache = self._read_download_cache()
+        cached = download_cache.get(self.zip_url, {})
+        headers = {}
+        if cached.get("sha256"):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        request = urllib.request.Request(self.zip_url, headers=headers)
+
+        # Hash the ZIP while it streams in instead of writing it to disk and running shasum
+        print(f"📥 Downloading {self.zip_url} to calculate checksum...")
+        digest = _new_sha256()
+        try:
+            with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                # http.client returns b"" instead of raising when the connection drops before Content-Length bytes
+                # arrived; length is the number of bytes still expected (None without a Content-Length header)
+                missing_bytes = response.length
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except (OSError, http.client.HTTPException) as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                self._release_sha256 = cached["sha256"]
+                print(f"🔍 Release ZIP not modified since last download, reusing SHA256: {self._release_sha256}")
+                return self._release_sha256
+            print(f"⚠️ Could not download ZIP file for checksum calculation: {e}")
+            print("Using :no_check for SHA256")
+            return None
 
-            sha256 = checksum_result.stdout.split()[0]
-            print(f"🔍 Calculated SHA256: {sha256}")
-
-            # Update the cask file
-            with open(cask_path, "r") as f:
-                content = f.read()
+        if missing_bytes:
+            print(f"⚠️ Download of {self.zip_url} ended {missing_bytes} bytes short, not using it for the checksum")
+            print("Using :no_check for SHA256")
+            return None
+
+        self._release_sha256 = digest.hexdigest()
+        print(f"🔍 Calculated SHA256: {self._release_sha256}")
+
+        # Only cache a digest whose body length matched Content-Length; a bad entry would be reused on every 304
+        if missing_bytes == 0 and (etag or last_modified):
+            download_cache[self.zip_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "sha256": self._release_sha256,
+            }
+            self._write_download_cache(download_cache)
+        return self._release_sha256
+
+    def _read_download_cache(self):
+        """Load the cached ETag/Last-Modified/SHA256 entries for release downloads, keyed by URL."""
+        try:
+            with open(self.download_cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-            # Replace the sha256 line
-            updated_content = re.sub(r"sha256 :no_check", f'sha256 "{sha256}"', content)
+    def _write_download_cache(self, download_cache):
+        """Save the release download cache; failing to write it only costs a full download next time."""
+        try:
+            self.download_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.download_cache_path, "w") as f:
+                json.dump(download_cache, f, indent=2)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not save download cache: {e}")
+
+    def _update_checksum(self, path, kind):
+        """Update the SHA256 checksum in a Homebrew formula or cask file (kind is used in messages)."""
+        try:
+            # The release ZIP is downloaded and hashed only once per release
+            sha256 = self._get_release_sha256()
+            if sha256 is None:
+                return
 
-            with open(cask_path, "w") as f:
-                f.write(updated_content)
+            # Replace the sha256 placeholder line
+            content = path.read_bytes()
+            if SHA256_PLACEHOLDER not in content:
+                print(f"⚠️ Warning: No 'sha256 :no_check' placeholder in the {kind}, checksum not updated")
+                return
+            updated_content = content.replace(SHA256_PLACEHOLDER, f'sha256 "{sha256}"'.encode(), 1)
 
-            print("✅ Updated cask with calculated checksum")
+            # Write a sibling file and rename it over the original so a crash never leaves a partial file
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_bytes(updated_content)
+            os.replace(tmp_path, path)
 
-            # Clean up temporary file
-            try:
-                os.unlink("/tmp/WinDock.zip")
-            except Exception:
-                pass
+            print(f"✅ Updated {kind} with calculated checksum")
 
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️ Error calculating checksum: {e}")
-            print("Using :no_check for SHA256")
         except Exception as e:
             print(f"⚠️ Error updating checksum: {e}")
 
@@ -892,7 +1235,16 @@ def main():
         help="Version bump type (default: patch)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Perform a dry run without making any changes")
+    parser.add_argument(
+        "--local-zip",
+        type=Path,
+        metavar="PATH",
+        help="Hash this WinDock.zip for the Homebrew checksum instead of downloading the release asset",
+    )
     args = parser.parse_args()
+    # Reject a bad --local-zip up front instead of letting the checksum come from some other file
+    if args.local_zip is not None and not (args.local_zip.is_file() and args.local_zip.stat().st_size > 0):
+        parser.error(f"--local-zip {args.local_zip} is not a non-empty file")
 
     if args.dry_run:
         print("🔍 DRY RUN MODE: No changes will be committed or pushed")
@@ -900,6 +1252,25 @@ def main():
     release_manager = ReleaseManager()
     # Set dry run mode attribute if we implement it
     release_manager.dry_run = args.dry_run if hasattr(args, "dry_run") else False
+    release_manager.local_zip = args.local_zip
+
+    if release_manager.dry_run:
+        # Fast path: only work out the new version, every other step spawns processes or hits the network
+        try:
+            release_manager.get_current_version()
+            release_manager.calculate_new_version(args.version_type)
+        except RuntimeError as e:
+            print(f"❌ Error during dry run: {e}")
+            return
+
+        print(f"🔍 [DRY RUN] Release {release_manager.tag_name} would:")
+        print(f"  - Update Info.plist and the Homebrew formula to version {release_manager.new_version}")
+        print("  - Build WinDock.app and create WinDock.zip")
+        print(f"  - Commit the version bump and push tag {release_manager.tag_name}")
+        print("  - Generate release notes and create the GitHub release")
+        print("  - Submit the updated formula to the Homebrew tap")
+        return
+
     try:
         release_manager.run(args.version_type)
         print("🚀 Release script completed successfully!")
@@ -909,7 +1280,9 @@ def main():
         print(f"❌ Error during release process: {e}")
         print("Reverting Info.plist to the original version...")
         # use git to reset the file
-        subprocess.run(["git", "restore", str(release_manager.info_plist_path)], check=True)
+        subprocess.run(
+            ["git", "restore", str(release_manager.info_plist_path)], cwd=release_manager.root_dir, check=True
+        )
 
 
 if __name__ == "__main__":
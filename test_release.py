@@ -23,6 +23,11 @@ def test_release_manager():
         release_manager.get_current_version()
         print(f"📊 Current version: {release_manager.current_version}")
 
+        # Test that the version is cached and Info.plist is not read again
+        release_manager.info_plist_path = release_manager.root_dir / "missing-Info.plist"
+        assert release_manager.get_current_version() == release_manager.current_version, "version was not cached"
+        print("✅ Current version is cached after the first read")
+
         # Test version calculation
         release_manager.calculate_new_version("patch")
         print(f"📈 New version would be: {release_manager.new_version}")
@@ -30,6 +35,9 @@ def test_release_manager():
         print("✅ Basic functionality test passed!")
         return True
 
+    except AssertionError:
+        # Let failed checks propagate so pytest and the script's exit code both report them
+        raise
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False